@@ -1,13 +1,16 @@
 import argparse
 import spacy
 import os
-import glob
+import fnmatch
+import hashlib
+import json
 import sys
 import re
 import nltk
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from nltk.corpus import wordnet as wn
 import string
 
@@ -207,41 +210,131 @@ def redact_phones(text):
     redacted_text, count = phone_pattern.subn(lambda x: redact_text_with_char(x.group()), text)
     return redacted_text, count
 
-def redact_addresses(text):
-    count = 0
+# Street suffixes and state abbreviations used by address detection.
+# Extend these tables (or pass your own to build_address_patterns) to cover more formats.
+STREET_SUFFIXES = (
+    'Street', 'St', 'Avenue', 'Ave', 'Boulevard', 'Blvd', 'Road', 'Rd', 'Drive', 'Dr',
+    'Lane', 'Ln', 'Way', 'Court', 'Ct', 'Circle', 'Cir', 'Place', 'Pl', 'Square', 'Sq', 'Loop', 'Broadway',
+)
+STATE_ABBREVIATIONS = (
+    'AL', 'AK', 'AS', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FM', 'FL', 'GA', 'GU', 'HI', 'ID', 'IL',
+    'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MH', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO',
+    'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'MP', 'OH', 'OK', 'OR', 'PW', 'PA', 'PR', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VI', 'VA', 'WA', 'WV', 'WI', 'WY',
+)
+
+def build_address_patterns(street_suffixes=STREET_SUFFIXES, states=STATE_ABBREVIATIONS):
+    """
+    Compiles the address regexes and their prefilters from the suffix and state tables.
+
+    Parameters:
+    - street_suffixes (iterable of str): Words that end a street address (e.g. "Street", "Ave").
+    - states (iterable of str): State abbreviations accepted before a ZIP code.
 
-    # Regular expressions for street addresses, city/state/ZIP, and floor numbers
-    address_patterns = [
+    Returns:
+    - patterns (dict): Compiled patterns, passed to find_address_spans.
+    """
+    suffix_alternation = '|'.join(re.escape(suffix) for suffix in street_suffixes)
+    state_alternation = '|'.join(re.escape(state) for state in states)
+    return {
         # Matches street addresses (e.g., "123 Main Street", "260 Franklin Street, 19th Floor")
-        re.compile(
+        'street': re.compile(
             r'^\s*(\d{1,5}\s(?:[A-Z][a-z]+\s){0,4}'
-            r'(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr|'
-            r'Lane|Ln|Way|Court|Ct|Circle|Cir|Place|Pl|Square|Sq|Loop|Broadway)'
+            r'(?:' + suffix_alternation + r')'
             r'(?:,\s?\d{1,3}(?:st|nd|rd|th)\s(?:Floor|Fl))?)',
             re.IGNORECASE | re.MULTILINE
         ),
         # Matches city, state abbreviation, and ZIP code on a line (e.g., "Springfield, IL 62704")
-        re.compile(
+        'city': re.compile(
             r'^\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+)*,\s?'
-            r'(?:AL|AK|AS|AZ|AR|CA|CO|CT|DE|DC|FM|FL|GA|GU|HI|ID|IL|'
-            r'IN|IA|KS|KY|LA|ME|MH|MD|MA|MI|MN|MS|MO|'
-            r'MT|NE|NV|NH|NJ|NM|NY|NC|ND|MP|OH|OK|OR|PW|PA|PR|RI|SC|'
-            r'SD|TN|TX|UT|VT|VI|VA|WA|WV|WI|WY)\s?\d{5}(?:-\d{4})?)',
+            r'(?:' + state_alternation + r')\s?\d{5}(?:-\d{4})?)',
             re.IGNORECASE | re.MULTILINE
         ),
         # Matches floor numbers on a line (e.g., "5th Floor")
-        re.compile(
+        'floor': re.compile(
             r'^\s*(\d{1,3}(?:st|nd|rd|th)\s(?:Floor|Fl))',
             re.IGNORECASE | re.MULTILINE
         ),
-    ]
-    # Collect spans to redact
-    redaction_spans = []
+        # Prefilter: lines whose first non-blank character is a digit (street and floor candidates)
+        'digit_line': re.compile(r'^\s*\d', re.MULTILINE),
+        # Prefilter: the ", ST 12345" tail every city/state/ZIP match must contain
+        'state_zip': re.compile(r',\s?(?:' + state_alternation + r')\s?\d{5}', re.IGNORECASE),
+        # Prefilter: a stretch made only of characters a city name can contain. Same set as
+        # [A-Z\s] under IGNORECASE (which also folds in İ, ı, ſ and the Kelvin sign), spelled
+        # out because case-insensitive classes are several times slower to scan.
+        'city_run': re.compile('[A-Za-z\u0130\u0131\u017f\u212a\\s]*'),
+    }
+
+ADDRESS_PATTERNS = build_address_patterns()
+
+def _match_at_line_starts(pattern, text, line_starts):
+    """
+    Runs an anchored pattern only at the given line starts (in ascending order), returning
+    the same group spans pattern.finditer(text) would, as long as no other line start can match.
+    """
+    spans = []
+    last_end = 0
+    for line_start in line_starts:
+        if line_start < last_end:
+            continue
+        match = pattern.match(text, line_start)
+        if match:
+            spans.append((match.start(1), match.end(1)))
+            last_end = match.end()
+    return spans
+
+def find_address_spans(text, patterns=None):
+    """
+    Finds the (start, end) spans of street addresses, city/state/ZIP lines and floor numbers.
+
+    Instead of trying every pattern at every line start, cheap prefilters pick the candidate
+    lines first: street and floor patterns only run on lines starting with a digit, and the
+    city pattern only runs on lines leading up to a ", ST 12345" tail. The full patterns are
+    still matched against the whole text, so the spans are identical to a plain finditer.
+
+    Parameters:
+    - text (str): The input text to be searched.
+    - patterns (dict): Patterns from build_address_patterns, defaults to ADDRESS_PATTERNS.
 
-    for pattern in address_patterns:
-        for match in pattern.finditer(text):
-            start, end = match.start(1), match.end(1)
-            redaction_spans.append((start, end))
+    Returns:
+    - spans (list of tuple): Unmerged spans, in no particular order.
+    """
+    if patterns is None:
+        patterns = ADDRESS_PATTERNS
+    spans = []
+
+    digit_lines = [match.start() for match in patterns['digit_line'].finditer(text)]
+    if digit_lines:
+        spans.extend(_match_at_line_starts(patterns['street'], text, digit_lines))
+        spans.extend(_match_at_line_starts(patterns['floor'], text, digit_lines))
+
+    city_lines = set()
+    city_run = patterns['city_run']
+    for match in patterns['state_zip'].finditer(text):
+        # The city name runs back from the comma over letters and whitespace only, so a match
+        # can only start on this line or on earlier lines joined to it by such a run. Walk back
+        # a line at a time and stop at the first line that breaks the run; extra candidates are
+        # harmless since the full pattern still has to match there.
+        end = match.start()
+        while True:
+            newline = text.rfind('\n', 0, end)
+            line_start = newline + 1
+            if line_start in city_lines:
+                break
+            city_lines.add(line_start)
+            if newline == -1 or not city_run.fullmatch(text, line_start, end):
+                break
+            end = newline
+    if city_lines:
+        spans.extend(_match_at_line_starts(patterns['city'], text, sorted(city_lines)))
+
+    return spans
+
+def redact_addresses(text, patterns=None):
+    count = 0
+
+    # Collect spans to redact
+    redaction_spans = find_address_spans(text, patterns)
 
     # Remove overlapping spans
     redaction_spans = sorted(redaction_spans, key=lambda x: x[0])
@@ -381,6 +474,411 @@ def redact_entities(text, args):
     return text, total_counts
 
 
+def glob_to_regex(pattern):
+    """
+    Translates a recursive glob pattern into a compiled regex matching whole paths.
+
+    `**` as a whole component matches any number of directories, `*` and `?` never cross
+    a path separator, and wildcards don't match a leading `.` unless the pattern spells it
+    out, mirroring glob.glob(recursive=True).
+    """
+    i, n = 0, len(pattern)
+    regex = ''
+    while i < n:
+        char = pattern[i]
+        component_start = i == 0 or pattern[i - 1] == '/'
+        if component_start and pattern.startswith('**', i) and (i + 2 == n or pattern[i + 2] == '/'):
+            if i + 2 == n:
+                regex += r'(?:(?!\.)[^/]+/)*(?!\.)[^/]*'
+            else:
+                regex += r'(?:(?!\.)[^/]+/)*'
+            i += 3
+            continue
+        if component_start and char in '*?[':
+            regex += r'(?!\.)'
+        if char == '*':
+            regex += r'[^/]*'
+        elif char == '?':
+            regex += r'[^/]'
+        elif char == '[':
+            j = i + 1
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            close = pattern.find(']', j)
+            if close == -1:
+                regex += re.escape(char)
+            else:
+                # Escape everything re treats specially inside a set, as fnmatch.translate does
+                group = pattern[i + 1:close].replace('\\', '\\\\').replace('[', '\\[')
+                group = re.sub(r'([&~|])', r'\\\1', group)
+                if group.startswith('!'):
+                    group = '^' + group[1:]
+                elif group.startswith('^'):
+                    group = '\\' + group
+                regex += '[' + group + ']'
+                i = close
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex + r'\Z')
+
+def parse_shard(value):
+    """
+    Parses a `--shard i/N` argument into an (index, total) tuple with 0 <= i < N.
+    """
+    match = re.fullmatch(r'(\d+)/(\d+)', value.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Shard must look like i/N, got: {value}")
+    index, total = int(match.group(1)), int(match.group(2))
+    if total < 1 or index >= total:
+        raise argparse.ArgumentTypeError(f"Shard index must satisfy 0 <= i < N, got: {value}")
+    return index, total
+
+def in_shard(file_path, shard):
+    """
+    Returns True if the file belongs to the given (index, total) shard.
+
+    Uses a stable digest of the path rather than hash(), which is salted per process,
+    so every host assigns the same files to the same shard. Pass the path relative to
+    the walk base so the assignment doesn't depend on where the archive is mounted.
+    """
+    if shard is None:
+        return True
+    index, total = shard
+    digest = hashlib.sha1(file_path.encode('utf-8', 'surrogateescape')).digest()
+    return int.from_bytes(digest[:8], 'big') % total == index
+
+def iter_input_files(pattern, include=None, exclude=None, min_size=None, max_size=None, shard=None,
+                     skip_dir=None):
+    """
+    Lazily yields the files matching a glob pattern using os.scandir.
+
+    Unlike glob.glob, nothing is collected up front: directories are walked one at a time
+    (in sorted order, so runs are reproducible) and files are yielded as soon as they match.
+
+    Parameters:
+    - pattern (str): Glob for input files, `**` is recursive.
+    - include (list of str): Basename patterns a file must match at least one of.
+    - exclude (list of str): Basename patterns that skip a file.
+    - min_size (int): Skip files smaller than this many bytes.
+    - max_size (int): Skip files larger than this many bytes.
+    - shard (tuple of int): (index, total) slice of the matched files to keep.
+    - skip_dir (str): Directory not to descend into, e.g. the output directory, whose files
+      this same run is writing while the walk is still going.
+
+    Yields:
+    - file_path (str): Path of each selected file, in the same form glob.glob would return it.
+    """
+    pattern = pattern.replace(os.sep, '/')
+    parts = pattern.split('/')
+
+    # Walk from the longest prefix that contains no wildcard characters
+    magic_index = next((i for i, part in enumerate(parts) if re.search(r'[*?[]', part)), None)
+    if magic_index is None:
+        base = os.path.dirname(pattern)
+        candidates = [(pattern, None)] if os.path.isfile(pattern) else []
+        matcher = None
+    else:
+        base = '/'.join(parts[:magic_index])
+        if not base and pattern.startswith('/'):
+            base = '/'
+        matcher = glob_to_regex(pattern)
+        max_depth = None if '**' in pattern else len(parts) - magic_index
+        # Like glob, only look inside hidden entries when the pattern names one
+        include_hidden = any(part.startswith('.') for part in parts[magic_index:])
+        if skip_dir is not None:
+            skip_dir = os.path.abspath(skip_dir)
+        candidates = _walk_files(base, max_depth, include_hidden, skip_dir)
+    base_prefix = base.rstrip('/') + '/' if base else ''
+
+    for file_path, entry in candidates:
+        if matcher is not None and not matcher.match(file_path):
+            continue
+        name = os.path.basename(file_path)
+        if include and not any(fnmatch.fnmatch(name, inc) for inc in include):
+            continue
+        if exclude and any(fnmatch.fnmatch(name, exc) for exc in exclude):
+            continue
+        if min_size is not None or max_size is not None:
+            try:
+                size = entry.stat().st_size if entry is not None else os.path.getsize(file_path)
+            except OSError:
+                continue
+            if (min_size is not None and size < min_size) or (max_size is not None and size > max_size):
+                continue
+        if not in_shard(file_path[len(base_prefix):], shard):
+            continue
+        yield file_path
+
+def _walk_files(base, max_depth, include_hidden=False, skip_dir=None, depth=1):
+    """
+    Recursively yields (path, DirEntry) for files under base, skipping hidden entries
+    like glob does unless include_hidden is set, and never entering skip_dir (an absolute
+    path). Recursion stops at max_depth when the pattern has no `**`.
+    """
+    try:
+        with os.scandir(base or '.') as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith('.') and not include_hidden:
+            continue
+        path = entry.name if not base else base.rstrip('/') + '/' + entry.name
+        try:
+            if entry.is_dir():
+                if skip_dir is not None and os.path.abspath(path) == skip_dir:
+                    continue
+                if max_depth is None or depth < max_depth:
+                    yield from _walk_files(path, max_depth, include_hidden, skip_dir, depth + 1)
+            elif entry.is_file():
+                yield path, entry
+        except OSError:
+            continue
+
+JOURNAL_NAME = '.redactor_journal.jsonl'
+
+def load_journal(journal_path):
+    """
+    Reads a job journal and returns the counts recorded for each completed input file.
+
+    A run that died mid-write can leave a truncated last line, which is ignored so the
+    file it described is simply redone (open_journal drops it before appending).
+
+    Parameters:
+    - journal_path (str): Path to the journal written by a previous run.
+
+    Returns:
+    - completed (dict): Maps each completed input path to its redaction counts.
+    """
+    completed = {}
+    if not os.path.exists(journal_path):
+        return completed
+    with open(journal_path, 'r', encoding='utf-8') as journal:
+        for line in journal:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and 'file' in entry and 'counts' in entry:
+                completed[entry['file']] = entry['counts']
+    return completed
+
+def open_journal(journal_path, resume):
+    """
+    Opens the journal for writing: truncated for a fresh run, appended to when resuming.
+
+    When resuming, a partial last line left by a killed run is cut off first, so the next
+    entry starts on its own line instead of being glued onto the broken one.
+    """
+    if not resume or not os.path.exists(journal_path):
+        return open(journal_path, 'w', encoding='utf-8')
+    with open(journal_path, 'rb+') as journal:
+        position = journal.seek(0, os.SEEK_END)
+        keep = 0
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            journal.seek(position)
+            newline = journal.read(step).rfind(b'\n')
+            if newline != -1:
+                keep = position + newline + 1
+                break
+        journal.truncate(keep)
+    return open(journal_path, 'a', encoding='utf-8')
+
+def record_journal(journal, file_path, output_path, counts):
+    """
+    Appends a completed input file and its counts to the open journal.
+    """
+    journal.write(json.dumps({'file': file_path, 'output': output_path, 'counts': counts}) + '\n')
+
+def flush_journal(journal):
+    """
+    Forces journal entries to disk so they survive the process being killed.
+    """
+    journal.flush()
+    os.fsync(journal.fileno())
+
+def merge_counts(total_counts, counts):
+    for key, count in counts.items():
+        total_counts[key] = total_counts.get(key, 0) + count
+    return total_counts
+
+def write_output(file_path, redacted_content, args):
+    """
+    Writes redacted content for an input file into the output directory.
+
+    Returns:
+    - output_path (str): Path of the censored file.
+    """
+    output_dir = os.path.abspath(args.output)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    output_path = os.path.join(output_dir, os.path.basename(file_path) + ".censored")
+    with open(output_path, 'w', encoding='utf-8') as file:
+        file.write(redacted_content)
+    return output_path
+
+def redact_file(file_path, args):
+    """
+    Redacts a single input file and writes the result into the output directory.
+
+    Returns:
+    - output_path (str): Path of the censored file.
+    - total_counts (dict): Redaction counts for the file.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    redacted_content, total_counts = redact_entities(content, args)
+    return write_output(file_path, redacted_content, args), total_counts
+
+def redact_file_batch(file_paths, args):
+    """
+    Redacts several files in one worker task, so tiny files don't each pay a round trip.
+
+    Returns:
+    - results (list of tuple): (file_path, output_path, total_counts) for each file.
+    """
+    return [(file_path,) + redact_file(file_path, args) for file_path in file_paths]
+
+def split_segments(text, max_chars):
+    """
+    Splits text into consecutive segments of about max_chars characters, cut only right
+    after a blank line.
+
+    No phone or address pattern can match across a blank line, so redacting the segments
+    finds exactly what redacting the whole text would. A segment only runs past max_chars
+    when there is no blank line to cut at, up to the next one (or the end of the text);
+    it is never cut mid-line or mid-word. Every redaction keeps the text length, so joining
+    the redacted segments puts everything back at its original offset.
+    """
+    segments = []
+    start = 0
+    while len(text) - start > max_chars:
+        cut = text.rfind('\n\n', start, start + max_chars)
+        if cut == -1:
+            cut = text.find('\n\n', start + max_chars)
+            if cut == -1:
+                break
+        cut += 2
+        segments.append(text[start:cut])
+        start = cut
+    segments.append(text[start:])
+    return segments
+
+def can_split(args):
+    """
+    Returns True if documents can be redacted in segments with the enabled redactors.
+
+    Only the phone and address regexes are safe to run on segments. spaCy's entities and
+    sentences for names, dates and concepts depend on the surrounding text, so with any
+    of those enabled each document is redacted whole.
+    """
+    return not (args.names or args.dates or args.concept)
+
+def schedule_inputs(file_paths, window, split_size, batch_size):
+    """
+    Groups input files into worker tasks, largest first.
+
+    Files are read ahead `window` at a time and sorted by size within each window, so the
+    biggest documents start early instead of leaving cores idle at the end of the run,
+    while the input is still consumed lazily.
+
+    Yields:
+    - task (tuple): ('split', [path]) for files over split_size bytes (none if split_size
+      is None), which are redacted in segments, or ('batch', [paths]) for everything else,
+      with files under batch_size bytes coalesced until the batch holds about batch_size bytes.
+    """
+    def flush(sized_files):
+        sized_files.sort(key=lambda item: item[1], reverse=True)
+        batch, batch_bytes = [], 0
+        for file_path, size in sized_files:
+            if split_size is not None and size > split_size:
+                yield ('split', [file_path])
+            elif size >= batch_size:
+                yield ('batch', [file_path])
+            else:
+                batch.append(file_path)
+                batch_bytes += size
+                if batch_bytes >= batch_size:
+                    yield ('batch', batch)
+                    batch, batch_bytes = [], 0
+        if batch:
+            yield ('batch', batch)
+
+    sized_files = []
+    for file_path in file_paths:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        sized_files.append((file_path, size))
+        if len(sized_files) >= window:
+            yield from flush(sized_files)
+            sized_files = []
+    yield from flush(sized_files)
+
+def redact_files_parallel(file_paths, args, on_complete):
+    """
+    Redacts files on a pool of args.workers processes, calling
+    on_complete(file_path, output_path, total_counts) in the parent as each file finishes.
+
+    Files larger than args.split_size are split at blank lines into segments that are
+    redacted in parallel and reassembled before writing, as long as can_split(args) allows;
+    tiny files are batched. Results arrive in completion order, not input order.
+    """
+    split_size = args.split_size if can_split(args) else None
+    max_pending = args.workers * 4
+    pending = {}
+    segments = {}
+
+    def collect(done):
+        for future in done:
+            kind, key = pending.pop(future)
+            if kind == 'batch':
+                for file_path, output_path, total_counts in future.result():
+                    on_complete(file_path, output_path, total_counts)
+                continue
+            file_path, index = key
+            parts = segments[file_path]
+            parts[index] = future.result()
+            if any(part is None for part in parts):
+                continue
+            del segments[file_path]
+            total_counts = {}
+            for _, counts in parts:
+                merge_counts(total_counts, counts)
+            output_path = write_output(file_path, ''.join(redacted for redacted, _ in parts), args)
+            on_complete(file_path, output_path, total_counts)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        tasks = schedule_inputs(file_paths, max_pending * 16, split_size, args.batch_size)
+        for kind, task_paths in tasks:
+            if kind == 'split':
+                file_path = task_paths[0]
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    parts = split_segments(file.read(), split_size)
+                segments[file_path] = [None] * len(parts)
+                for index, segment in enumerate(parts):
+                    pending[executor.submit(redact_entities, segment, args)] = ('segment', (file_path, index))
+            else:
+                pending[executor.submit(redact_file_batch, task_paths, args)] = ('batch', None)
+            while len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+def format_stats(header, total_counts):
+    stats = f"{header}\nRedacted Entities:\n"
+    for key, count in total_counts.items():
+        stats += f"- {key.capitalize()}: {count}\n"
+    return stats
+
 def main():
     parser = argparse.ArgumentParser(description='Redact sensitive information from text files.')
     parser.add_argument('--input', type=str, help='Glob for input text files', required=True)
@@ -391,32 +889,82 @@ def main():
     parser.add_argument('--address', action='store_true', help='Censor addresses')
     parser.add_argument('--concept', action='append', help='Censor specific concepts', required=False)
     parser.add_argument('--stats', type=str, help='Output statistics to a file or stderr/stdout', default='stdout')
+    parser.add_argument('--include', action='append', help='Only process files whose name matches this pattern')
+    parser.add_argument('--exclude', action='append', help='Skip files whose name matches this pattern')
+    parser.add_argument('--min-size', type=int, help='Skip files smaller than this many bytes')
+    parser.add_argument('--max-size', type=int, help='Skip files larger than this many bytes')
+    parser.add_argument('--shard', type=parse_shard, help='Only process shard i of N (e.g. 0/4), split by path hash')
+    parser.add_argument('--journal', type=str, help=f'Job journal path (default: <output>/{JOURNAL_NAME})')
+    parser.add_argument('--resume', action='store_true', help='Skip files already completed in the journal')
+    parser.add_argument('--checkpoint-every', type=int, default=10, help='Flush the journal every N files')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes')
+    parser.add_argument('--split-size', type=int, default=500000,
+                        help='With --workers and only --phones/--address, redact files larger than '
+                             'this many bytes in parallel segments split at blank lines')
+    parser.add_argument('--batch-size', type=int, default=65536,
+                        help='With --workers, group files smaller than this many bytes into one task')
     args = parser.parse_args()
 
-    input_files = glob.glob(args.input, recursive=True)
-    if not input_files:
+    input_files = iter_input_files(
+        args.input,
+        include=args.include,
+        exclude=args.exclude,
+        min_size=args.min_size,
+        max_size=args.max_size,
+        shard=args.shard,
+        skip_dir=args.output,
+    )
+
+    output_dir = os.path.abspath(args.output)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    journal_path = args.journal or os.path.join(output_dir, JOURNAL_NAME)
+    completed = load_journal(journal_path) if args.resume else {}
+    if completed:
+        print(f"Resuming: {len(completed)} files already completed in {journal_path}")
+
+    summary_counts = {}
+    file_count = 0
+    resumed_count = 0
+    processed_count = 0
+
+    def remaining_files():
+        nonlocal file_count, resumed_count
+        for file_path in input_files:
+            file_count += 1
+            if file_path in completed:
+                resumed_count += 1
+                merge_counts(summary_counts, completed[file_path])
+                continue
+            yield file_path
+
+    def finish_file(file_path, output_path, total_counts):
+        nonlocal processed_count
+        print(f"File written to: {output_path}")
+        write_stats(format_stats(f"File: {file_path}", total_counts), args.stats)
+        merge_counts(summary_counts, total_counts)
+        record_journal(journal, file_path, output_path, total_counts)
+        processed_count += 1
+        if processed_count % max(args.checkpoint_every, 1) == 0:
+            flush_journal(journal)
+
+    with open_journal(journal_path, args.resume) as journal:
+        try:
+            if args.workers > 1:
+                redact_files_parallel(remaining_files(), args, finish_file)
+            else:
+                for file_path in remaining_files():
+                    print(f"Processing file: {file_path}")
+                    finish_file(file_path, *redact_file(file_path, args))
+        finally:
+            flush_journal(journal)
+
+    if not file_count:
         print(f"No files matched the input pattern: {args.input}")
         return
 
-    for file_path in input_files:
-        if os.path.isfile(file_path):
-            print(f"Processing file: {file_path}")
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            redacted_content, total_counts = redact_entities(content, args)
-            output_dir = os.path.abspath(args.output)
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            output_path = os.path.join(output_dir, os.path.basename(file_path) + ".censored")
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(redacted_content)
-            print(f"File written to: {output_path}")
-            stats = f"File: {file_path}\nRedacted Entities:\n"
-            for key, count in total_counts.items():
-                stats += f"- {key.capitalize()}: {count}\n"
-            write_stats(stats, args.stats)
-        else:
-            print(f"Skipping non-file item: {file_path}")
+    summary = f"Summary: {file_count} files ({resumed_count} from previous run)"
+    write_stats(format_stats(summary, summary_counts), args.stats)
 
 def write_stats(stats, output_path):
     if output_path == 'stderr':
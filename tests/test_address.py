@@ -1,7 +1,7 @@
 
 import unittest
 import textwrap
-from redactor import redact_addresses
+from redactor import redact_addresses, build_address_patterns, STREET_SUFFIXES
 
 class TestRedactAddresses(unittest.TestCase):
 
@@ -83,5 +83,30 @@ class TestRedactAddresses(unittest.TestCase):
         redacted_text, _ = redact_addresses(text)
         self.assertEqual(redacted_text.strip(), expected_output.strip())
 
+    def test_custom_suffix_table(self):
+        text = "Ship it to:\n12 Harbour Quay\nThanks"
+        redacted_text, count = redact_addresses(text)
+        self.assertEqual(redacted_text, text)
+        self.assertEqual(count, 0)
+
+        patterns = build_address_patterns(street_suffixes=STREET_SUFFIXES + ('Quay',))
+        redacted_text, count = redact_addresses(text, patterns)
+        self.assertEqual(redacted_text, "Ship it to:\n" + '█' * len('12 Harbour Quay') + "\nThanks")
+        self.assertEqual(count, 1)
+
+    def test_city_line_after_blank_lines(self):
+        text = "Mail:\n\n   \nAustin, TX 78701 USA"
+        redacted_text, count = redact_addresses(text)
+        self.assertEqual(redacted_text, "Mail:\n\n   \n" + '█' * len('Austin, TX 78701') + " USA")
+        self.assertEqual(count, 1)
+
+    def test_city_run_across_lines(self):
+        # \s in the city pattern matches newlines, so the match starts at the first line
+        text = "Regards,\nDowntown\nSan Antonio, TX 78205\nThanks"
+        redacted_text, count = redact_addresses(text)
+        city_run = "Downtown\nSan Antonio, TX 78205"
+        self.assertEqual(redacted_text, "Regards,\n" + '█' * len(city_run) + "\nThanks")
+        self.assertEqual(count, 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,256 @@
+import argparse
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+import unittest
+
+from redactor import (
+    ADDRESS_PATTERNS,
+    find_address_spans,
+    iter_input_files,
+    redact_entities,
+    redact_file,
+    redact_file_batch,
+    redact_files_parallel,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILES = [
+    os.path.join(REPO_ROOT, name)
+    for name in ('names.txt', 'dates.txt', 'phones.txt', 'address.txt', 'concept.txt')
+]
+
+ALL_ENTITIES = dict(names=True, dates=True, phones=True, address=True, concept=None)
+REGEX_ENTITIES = dict(names=False, dates=False, phones=True, address=True, concept=None)
+CONCEPT_ENTITIES = dict(names=False, dates=False, phones=False, address=False, concept=['kids'])
+# Small enough that every generated document over a few paragraphs gets split
+SPLIT_SIZE = 2000
+
+STREETS = ['Main', 'Elm', 'Franklin', 'Oak Hill', 'Smith']
+SUFFIXES = ['Street', 'St', 'Ave', 'Blvd', 'Road', 'Lane', 'Broadway']
+CITIES = ['Springfield', 'Houston', 'San Antonio', 'Gainesville', 'New York']
+STATES = ['IL', 'TX', 'FL', 'NY', 'CA', 'tx']
+FILLER = [
+    'Please review the attached forecast before the meeting.',
+    'The kids will be at school until three.',
+    'Let me know if the numbers look right to you.',
+    'Dear John, thanks for the update.',
+    'We closed 42 deals last quarter.',
+]
+
+def generate_document(rng, paragraphs):
+    """
+    Builds a synthetic email body mixing filler sentences, sample-file lines and
+    addresses, phone numbers and dates in the formats the redactors look for.
+    """
+    sample_lines = []
+    for path in SAMPLE_FILES:
+        with open(path, encoding='utf-8') as file:
+            sample_lines.extend(line for line in file.read().splitlines() if line.strip())
+    blocks = []
+    for _ in range(paragraphs):
+        lines = []
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.randint(0, 6)
+            if kind == 0:
+                lines.append(f"{rng.randint(1, 99999)} {rng.choice(STREETS)} {rng.choice(SUFFIXES)}")
+                if rng.random() < 0.3:
+                    lines[-1] += f", {rng.randint(1, 40)}th Floor"
+            elif kind == 1:
+                lines.append(f"{rng.choice(CITIES)}, {rng.choice(STATES)} {rng.randint(10000, 99999)}")
+            elif kind == 2:
+                lines.append(f"Call ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}")
+            elif kind == 3:
+                lines.append(f"Sent {rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1990, 2024)}")
+            elif kind == 4:
+                lines.append(rng.choice(sample_lines))
+            else:
+                lines.append(' '.join(rng.choice(FILLER) for _ in range(rng.randint(1, 4))))
+        blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks) + '\n'
+
+def generate_unbroken_document(rng, length, wrap):
+    """
+    Builds a body with no blank lines, so there is nowhere safe to split it, packed with
+    multi-word phone numbers, addresses and dates so that any cut at a space or newline
+    would land inside one. With wrap set, the text is broken into short lines so entities
+    also straddle line breaks (e.g. "123 Main" / "Street").
+    """
+    entities = [
+        '352 392 1234',
+        '(352) 392-1234',
+        '123 Main Street',
+        'Springfield, IL 62704',
+        'December 29, 2000',
+        'Dear John',
+    ]
+    filler_words = ' '.join(FILLER).replace('.', '').split()
+    words = []
+    size = 0
+    while size < length:
+        chunk = rng.choice(entities) if rng.random() < 0.6 else rng.choice(filler_words)
+        words.extend(chunk.split(' '))
+        size += len(chunk) + 1
+    if not wrap:
+        return ' '.join(words) + '\n'
+    lines, line = [], []
+    for word in words:
+        line.append(word)
+        if rng.random() < 0.2:
+            lines.append(' '.join(line))
+            line = []
+    if line:
+        lines.append(' '.join(line))
+    return '\n'.join(lines) + '\n'
+
+def read_outputs(results):
+    outputs = {}
+    for file_path, output_path, counts in results:
+        with open(output_path, encoding='utf-8') as file:
+            outputs[file_path] = (file.read(), counts)
+    return outputs
+
+class TestRedactionEquivalence(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.timings = []
+        rng = random.Random(6930)
+        corpus_dir = os.path.join(cls.tmp.name, 'corpus')
+        os.makedirs(corpus_dir)
+        cls.generated = []
+        for index, paragraphs in enumerate([1, 2, 3, 5, 8, 13, 21, 200]):
+            path = os.path.join(corpus_dir, f'generated_{index}.txt')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(generate_document(rng, paragraphs))
+            cls.generated.append(path)
+        for name, wrap in (('single_line', False), ('wrapped', True)):
+            path = os.path.join(corpus_dir, f'unbroken_{name}.txt')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(generate_unbroken_document(rng, 5 * SPLIT_SIZE, wrap))
+            cls.generated.append(path)
+        cls.corpus = SAMPLE_FILES + cls.generated
+        cls.references = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        report = 'Redaction mode timings:\n' + ''.join(
+            f"- {mode:<32} {files:>3} files {seconds:8.3f}s\n" for mode, files, seconds in cls.timings
+        )
+        sys.stderr.write('\n' + report)
+        report_path = os.environ.get('REDACTOR_BENCH_OUTPUT')
+        if report_path:
+            with open(report_path, 'a', encoding='utf-8') as file:
+                file.write(report)
+        cls.tmp.cleanup()
+
+    def make_args(self, mode, options, **extra):
+        output = os.path.join(self.tmp.name, mode)
+        return argparse.Namespace(output=output, **options, **extra)
+
+    def timed(self, mode, files, run):
+        start = time.perf_counter()
+        result = run()
+        self.timings.append((mode, len(files), time.perf_counter() - start))
+        return result
+
+    def reference(self, label, files, options):
+        """
+        Redacts each file with redact_entities over its whole text, one at a time.
+        """
+        key = (label, tuple(files))
+        if key not in self.references:
+            args = self.make_args('reference', options)
+            def run():
+                outputs = {}
+                for file_path in files:
+                    with open(file_path, encoding='utf-8') as file:
+                        outputs[file_path] = redact_entities(file.read(), args)
+                return outputs
+            self.references[key] = self.timed(f'reference ({label})', files, run)
+        return self.references[key]
+
+    def run_parallel(self, mode, files, args):
+        results = []
+        def on_complete(file_path, output_path, counts):
+            results.append((file_path, output_path, counts))
+        self.timed(mode, files, lambda: redact_files_parallel(iter(files), args, on_complete))
+        return read_outputs(results)
+
+    def assertSameOutputs(self, outputs, expected):
+        self.assertEqual(sorted(outputs), sorted(expected))
+        for file_path, (text, counts) in expected.items():
+            with self.subTest(file=os.path.basename(file_path)):
+                self.assertEqual(outputs[file_path][0], text)
+                self.assertEqual(outputs[file_path][1], counts)
+
+    def test_sequential_files_match_reference(self):
+        expected = self.reference('all', self.corpus, ALL_ENTITIES)
+        args = self.make_args('sequential', ALL_ENTITIES)
+        results = self.timed('sequential (all)', self.corpus,
+                             lambda: [(path,) + redact_file(path, args) for path in self.corpus])
+        self.assertSameOutputs(read_outputs(results), expected)
+
+    def test_batched_matches_reference(self):
+        expected = self.reference('all', self.corpus, ALL_ENTITIES)
+        args = self.make_args('batched', ALL_ENTITIES)
+        results = self.timed('batched (all)', self.corpus, lambda: redact_file_batch(self.corpus, args))
+        self.assertSameOutputs(read_outputs(results), expected)
+
+    def test_parallel_matches_reference(self):
+        expected = self.reference('all', self.corpus, ALL_ENTITIES)
+        args = self.make_args('parallel', ALL_ENTITIES, workers=2, split_size=10 ** 9, batch_size=4096)
+        outputs = self.run_parallel('parallel, 2 workers (all)', self.corpus, args)
+        self.assertSameOutputs(outputs, expected)
+
+    def test_segmented_parallel_matches_reference(self):
+        # Held to the reference for every entity type, not just the ones that get split:
+        # with spaCy-based redactors enabled the mode has to fall back to whole documents.
+        for label, options in (('regex', REGEX_ENTITIES), ('all', ALL_ENTITIES)):
+            expected = self.reference(label, self.corpus, options)
+            args = self.make_args(f'segmented-{label}', options,
+                                  workers=2, split_size=SPLIT_SIZE, batch_size=4096)
+            outputs = self.run_parallel(f'segmented, 2 workers ({label})', self.corpus, args)
+            self.assertSameOutputs(outputs, expected)
+
+    def test_corpus_exercises_splitting(self):
+        sizes = {os.path.basename(path): os.path.getsize(path) for path in self.generated}
+        self.assertGreater(sizes['generated_7.txt'], SPLIT_SIZE)
+        for name in ('unbroken_single_line.txt', 'unbroken_wrapped.txt'):
+            self.assertGreater(sizes[name], 2 * SPLIT_SIZE)
+            with open(os.path.join(self.tmp.name, 'corpus', name), encoding='utf-8') as file:
+                self.assertNotIn('\n\n', file.read())
+
+    def test_concepts_parallel_matches_reference(self):
+        files = [os.path.join(REPO_ROOT, 'concept.txt')]
+        expected = self.reference('concepts', files, CONCEPT_ENTITIES)
+        for label, split_size in (('parallel', 10 ** 9), ('segmented', 500)):
+            args = self.make_args(f'{label}-concepts', CONCEPT_ENTITIES,
+                                  workers=2, split_size=split_size, batch_size=4096)
+            outputs = self.run_parallel(f'{label}, 2 workers (concepts)', files, args)
+            self.assertSameOutputs(outputs, expected)
+
+    def test_address_prefilter_matches_full_scan(self):
+        for file_path in self.corpus:
+            with open(file_path, encoding='utf-8') as file:
+                text = file.read()
+            full_scan = [
+                (match.start(1), match.end(1))
+                for name in ('street', 'city', 'floor')
+                for match in ADDRESS_PATTERNS[name].finditer(text)
+            ]
+            with self.subTest(file=os.path.basename(file_path)):
+                self.assertEqual(sorted(find_address_spans(text)), sorted(full_scan))
+
+    def test_walker_matches_glob(self):
+        for pattern in ('*.txt', '**/*.txt', 'tests/*.py', 'censored_files/*'):
+            pattern = os.path.join(REPO_ROOT, pattern)
+            expected = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+            with self.subTest(pattern=pattern):
+                self.assertEqual(sorted(iter_input_files(pattern)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
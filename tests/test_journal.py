@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from redactor import load_journal, open_journal, record_journal, flush_journal, merge_counts
+
+class TestJobJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmp.name, 'journal.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            record_journal(journal, 'a.txt', 'out/a.txt.censored', {'names': 2, 'phones': 1})
+            record_journal(journal, 'b.txt', 'out/b.txt.censored', {'names': 0, 'phones': 3})
+            flush_journal(journal)
+        completed = load_journal(self.journal_path)
+        self.assertEqual(completed, {
+            'a.txt': {'names': 2, 'phones': 1},
+            'b.txt': {'names': 0, 'phones': 3},
+        })
+
+    def test_truncated_last_line_is_ignored(self):
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            record_journal(journal, 'a.txt', 'out/a.txt.censored', {'names': 1})
+            journal.write('{"file": "b.txt", "outp')
+        self.assertEqual(load_journal(self.journal_path), {'a.txt': {'names': 1}})
+
+    def test_resume_after_truncated_line(self):
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            record_journal(journal, 'a.txt', 'out/a.txt.censored', {'names': 1})
+            journal.write('{"file": "b.txt", "outp')
+        with open_journal(self.journal_path, resume=True) as journal:
+            record_journal(journal, 'b.txt', 'out/b.txt.censored', {'names': 2})
+            record_journal(journal, 'c.txt', 'out/c.txt.censored', {'names': 3})
+        self.assertEqual(load_journal(self.journal_path), {
+            'a.txt': {'names': 1},
+            'b.txt': {'names': 2},
+            'c.txt': {'names': 3},
+        })
+
+    def test_resume_with_only_a_partial_line(self):
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            journal.write('{"file": "a.txt", "co')
+        with open_journal(self.journal_path, resume=True) as journal:
+            record_journal(journal, 'a.txt', 'out/a.txt.censored', {'names': 1})
+        self.assertEqual(load_journal(self.journal_path), {'a.txt': {'names': 1}})
+
+    def test_fresh_run_truncates(self):
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            record_journal(journal, 'a.txt', 'out/a.txt.censored', {'names': 1})
+        with open_journal(self.journal_path, resume=False) as journal:
+            record_journal(journal, 'b.txt', 'out/b.txt.censored', {'names': 2})
+        self.assertEqual(load_journal(self.journal_path), {'b.txt': {'names': 2}})
+
+    def test_missing_journal(self):
+        self.assertEqual(load_journal(self.journal_path), {})
+
+    def test_merge_counts(self):
+        total = merge_counts({'names': 1, 'dates': 2}, {'names': 3, 'phones': 4})
+        self.assertEqual(total, {'names': 4, 'dates': 2, 'phones': 4})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import argparse
+import os
+import tempfile
+import unittest
+
+from redactor import split_segments, can_split, schedule_inputs, redact_files_parallel, redact_file, redact_entities
+
+class TestSplitSegments(unittest.TestCase):
+    def test_segments_rejoin_to_original(self):
+        text = "First paragraph here.\n\nSecond one.\nStill second.\n\nThird paragraph is last."
+        segments = split_segments(text, 30)
+        self.assertEqual(''.join(segments), text)
+        self.assertTrue(all(segment.endswith('\n\n') for segment in segments[:-1]))
+
+    def test_cuts_after_paragraph(self):
+        text = "Alpha beta.\n\nGamma delta epsilon."
+        self.assertEqual(split_segments(text, 20), ["Alpha beta.\n\n", "Gamma delta epsilon."])
+
+    def test_never_cuts_inside_a_paragraph(self):
+        text = "call 352 392 1234 now\n123 Main\nStreet\nmore words here"
+        self.assertEqual(split_segments(text, 10), [text])
+
+    def test_long_paragraph_runs_to_next_blank_line(self):
+        text = "aaaa bbbb cccc\n\ndd"
+        self.assertEqual(split_segments(text, 7), ["aaaa bbbb cccc\n\n", "dd"])
+
+    def test_small_text_is_one_segment(self):
+        self.assertEqual(split_segments("short", 100), ["short"])
+
+    def test_segments_redact_like_whole_text(self):
+        args = argparse.Namespace(names=False, dates=False, phones=True, address=True, concept=None)
+        text = ("Call 352 392 1234 now or write to\n123 Main\nStreet\nSpringfield, IL 62704\n\n" * 20
+                + "call 352 392 1234 now " * 40)
+        for max_chars in (5, 37, 100, 400):
+            redacted, counts = [], {}
+            for segment in split_segments(text, max_chars):
+                segment_text, segment_counts = redact_entities(segment, args)
+                redacted.append(segment_text)
+                for key, count in segment_counts.items():
+                    counts[key] = counts.get(key, 0) + count
+            self.assertEqual((''.join(redacted), counts), redact_entities(text, args))
+
+    def test_can_split_only_regex_redactors(self):
+        options = dict(names=False, dates=False, phones=True, address=True, concept=None)
+        self.assertTrue(can_split(argparse.Namespace(**options)))
+        for key, value in (('names', True), ('dates', True), ('concept', ['kids'])):
+            self.assertFalse(can_split(argparse.Namespace(**dict(options, **{key: value}))))
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sizes = {'tiny1.txt': 10, 'tiny2.txt': 10, 'tiny3.txt': 10, 'medium.txt': 500, 'huge.txt': 5000}
+        for name, size in self.sizes.items():
+            with open(self.path(name), 'w', encoding='utf-8') as file:
+                file.write(('Call 123-456-7890 today.\n\n' * size)[:size])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_largest_first_with_batches(self):
+        paths = [self.path(name) for name in sorted(self.sizes)]
+        tasks = list(schedule_inputs(paths, window=100, split_size=1000, batch_size=25))
+        self.assertEqual(tasks, [
+            ('split', [self.path('huge.txt')]),
+            ('batch', [self.path('medium.txt')]),
+            ('batch', [self.path('tiny1.txt'), self.path('tiny2.txt'), self.path('tiny3.txt')]),
+        ])
+
+    def test_parallel_matches_sequential(self):
+        paths = [self.path(name) for name in sorted(self.sizes)]
+        options = dict(names=False, dates=False, phones=True, address=True, concept=None,
+                       workers=2, split_size=1000, batch_size=25)
+        sequential_args = argparse.Namespace(output=os.path.join(self.tmp.name, 'seq'), **options)
+        parallel_args = argparse.Namespace(output=os.path.join(self.tmp.name, 'par'), **options)
+
+        expected = {}
+        for file_path in paths:
+            output_path, counts = redact_file(file_path, sequential_args)
+            with open(output_path, encoding='utf-8') as file:
+                expected[file_path] = (file.read(), counts)
+
+        results = {}
+        def on_complete(file_path, output_path, counts):
+            with open(output_path, encoding='utf-8') as file:
+                results[file_path] = (file.read(), counts)
+        redact_files_parallel(iter(paths), parallel_args, on_complete)
+
+        self.assertEqual(results, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+
+from redactor import iter_input_files, parse_shard
+
+class TestInputWalker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        for rel_path, size in [
+            ('a.txt', 10),
+            ('b.log', 10),
+            ('sub/c.txt', 10),
+            ('sub/deep/d.txt', 5000),
+            ('.hidden/e.txt', 10),
+        ]:
+            path = os.path.join(self.root, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('x' * size)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def relative(self, paths):
+        return sorted(os.path.relpath(path, self.root).replace(os.sep, '/') for path in paths)
+
+    def test_recursive_glob(self):
+        files = iter_input_files(os.path.join(self.root, '**', '*.txt'))
+        self.assertEqual(self.relative(files), ['a.txt', 'sub/c.txt', 'sub/deep/d.txt'])
+
+    def test_non_recursive_glob(self):
+        files = iter_input_files(os.path.join(self.root, '*'))
+        self.assertEqual(self.relative(files), ['a.txt', 'b.log'])
+
+    def test_include_exclude(self):
+        files = iter_input_files(os.path.join(self.root, '**'), include=['*.txt'], exclude=['c.*'])
+        self.assertEqual(self.relative(files), ['a.txt', 'sub/deep/d.txt'])
+
+    def test_size_limits(self):
+        pattern = os.path.join(self.root, '**', '*.txt')
+        self.assertEqual(self.relative(iter_input_files(pattern, min_size=100)), ['sub/deep/d.txt'])
+        self.assertEqual(self.relative(iter_input_files(pattern, max_size=100)), ['a.txt', 'sub/c.txt'])
+
+    def test_shards_are_disjoint_and_complete(self):
+        pattern = os.path.join(self.root, '**')
+        shards = [set(iter_input_files(pattern, shard=(i, 3))) for i in range(3)]
+        self.assertEqual(sum(len(shard) for shard in shards), 4)
+        self.assertEqual(set.union(*shards), set(iter_input_files(pattern)))
+
+    def test_shards_do_not_depend_on_mount_point(self):
+        mounted = os.path.join(self.root, 'mnt', 'archive')
+        shutil.copytree(os.path.join(self.root, 'sub'), mounted)
+        for index in range(3):
+            here = iter_input_files(os.path.join(self.root, 'sub', '**'), shard=(index, 3))
+            there = iter_input_files(os.path.join(mounted, '**'), shard=(index, 3))
+            self.assertEqual(
+                sorted(os.path.relpath(path, os.path.join(self.root, 'sub')) for path in here),
+                sorted(os.path.relpath(path, mounted) for path in there),
+            )
+
+    def test_hidden_entries_named_by_pattern(self):
+        files = iter_input_files(os.path.join(self.root, '.*', '*.txt'))
+        self.assertEqual(self.relative(files), ['.hidden/e.txt'])
+
+    def test_bracket_in_character_class(self):
+        with open(os.path.join(self.root, 'x[1].txt'), 'w', encoding='utf-8') as file:
+            file.write('x')
+        files = iter_input_files(os.path.join(self.root, 'x[[]1].txt'))
+        self.assertEqual(self.relative(files), ['x[1].txt'])
+
+    def test_skips_output_dir_written_during_walk(self):
+        output_dir = os.path.join(self.root, 'zout')
+        os.makedirs(output_dir)
+        files = []
+        for path in iter_input_files(os.path.join(self.root, '**', '*'), skip_dir=output_dir):
+            files.append(path)
+            with open(os.path.join(output_dir, os.path.basename(path) + '.censored'), 'w') as file:
+                file.write('x')
+        self.assertEqual(self.relative(files), ['a.txt', 'b.log', 'sub/c.txt', 'sub/deep/d.txt'])
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard('2/5'), (2, 5))
+        for bad in ['5/5', '1/0', 'one/two']:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_shard(bad)
+
+if __name__ == '__main__':
+    unittest.main()